@@ -3,21 +3,69 @@
 Audio Extractor - Extract audio from videos using ffmpeg and yt-dlp
 """
 
+import importlib.util
 import os
 import sys
-import re
 import click
-import yt_dlp
-import ffmpeg
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, List
 import colorama
-from colorama import Fore, Style
+# ffmpeg-python and yt-dlp are imported inside the functions that use them,
+# so commands that don't need them (--help, check-dependencies, url vs. local)
+# don't pay for their imports at startup
 
-# Initialize colorama for Windows compatibility
-colorama.init()
+# Initialize colorama for Windows compatibility. Output that isn't a terminal
+# gets no colors (click.secho strips them), so skip the stream wrapper there.
+if sys.stdout.isatty():
+    colorama.init()
 
-def parse_time_format(time_str: str) -> str:
+# Appended to every invalid time format error
+_TIME_FORMAT_HELP = (
+    "Supported formats:\n"
+    "  • HH:MM:SS.mmm (e.g., 01:23:45.678)\n"
+    "  • MM:SS.mmm (e.g., 23:45.123)\n"
+    "  • SS.mmm (e.g., 45.500)\n"
+    "  • Decimal seconds (e.g., 105.250)"
+)
+
+# Bitrate and sample rate for each quality level
+_QUALITY_SETTINGS = MappingProxyType({
+    "high": {"bitrate": "320k", "sample_rate": "48000"},
+    "medium": {"bitrate": "192k", "sample_rate": "44100"},
+    "low": {"bitrate": "128k", "sample_rate": "44100"}
+})
+
+# Common video file extensions (lowercase, for str.endswith)
+_VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v')
+
+# Maximum number of files a single ffmpeg process handles in batch mode
+_BATCH_GROUP_SIZE = 8
+
+# Maximum number of URLs downloaded at the same time
+_MAX_CONCURRENT_DOWNLOADS = 8
+
+class ParsedTime(str):
+    """A validated time string that also carries its value
+    
+    Behaves exactly like the original string (comparisons, formatting,
+    passing to ffmpeg) so callers that only need the text are unaffected.
+    `milliseconds` is the exact value as an integer and `seconds` the
+    same value as a float.
+    """
+    
+    milliseconds: int
+    seconds: float
+    
+    def __new__(cls, time_str: str, milliseconds: int):
+        parsed = super().__new__(cls, time_str)
+        parsed.milliseconds = milliseconds
+        parsed.seconds = milliseconds / 1000
+        return parsed
+
+def parse_time_format(time_str: str) -> ParsedTime:
     """Parse and validate time format with millisecond precision support
     
     Supported formats:
@@ -31,43 +79,69 @@ def parse_time_format(time_str: str) -> str:
     - MM: minutes (0-59)
     - SS: seconds (0-59)
     - mmm: milliseconds (0-999, 1-3 digits)
+    
+    Returns the stripped string as a ParsedTime whose `milliseconds` and
+    `seconds` attributes hold the parsed value, so callers don't need to
+    parse it again.
     """
     if not time_str:
         raise click.BadParameter("Time parameter cannot be empty")
-        
-    # Remove whitespace
-    time_str = time_str.strip()
     
-    # Pattern for HH:MM:SS.mmm, MM:SS.mmm, or SS.mmm formats
-    # Supports millisecond precision with 1-3 digits
-    time_pattern = r'^(?:(?:([0-9]{1,2}):)?([0-5]?[0-9]):)?([0-5]?[0-9])(?:\.([0-9]{1,3}))?$'
+    # Strip before the cached lookup so padded and unpadded inputs share an entry
+    return _parse_time_format(time_str.strip())
+
+@lru_cache(maxsize=512)
+def _parse_time_format(time_str: str) -> ParsedTime:
+    """Cached parser behind parse_time_format; expects an already stripped string"""
+    if ':' not in time_str:
+        # Decimal seconds: digits with an optional 1-3 digit fraction
+        whole, dot, fraction = time_str.partition('.')
+        if whole.isdecimal() and (not dot or (fraction.isdecimal() and len(fraction) <= 3)):
+            return ParsedTime(time_str, int(whole) * 1000 + int(fraction.ljust(3, '0')))
+    else:
+        # Standard time format with optional milliseconds
+        total_ms = _scan_clock_time(time_str)
+        if total_ms is not None:
+            return ParsedTime(time_str, total_ms)
     
-    # Check if it's decimal seconds (integer or float with millisecond precision)
-    if re.match(r'^\d+(?:\.\d{1,3})?$', time_str):
-        return time_str
+    # If no match, raise an error with detailed format information
+    raise click.BadParameter(f"Invalid time format: '{time_str}'. {_TIME_FORMAT_HELP}")
+
+def _scan_clock_time(time_str: str) -> Optional[int]:
+    """Total milliseconds of an HH:MM:SS.mmm or MM:SS.mmm string, or None if invalid
     
-    # Check standard time format with optional milliseconds
-    match = re.match(time_pattern, time_str)
-    if match:
-        hours, minutes, seconds, milliseconds = match.groups()
-        
-        # Validate milliseconds don't exceed 999
-        if milliseconds and len(milliseconds) <= 3:
-            ms_value = int(milliseconds.ljust(3, '0'))  # Pad to 3 digits
-            if ms_value > 999:
-                raise click.BadParameter(f"Invalid milliseconds: '{milliseconds}'. Must be 0-999")
-        
-        return time_str
+    A direct scan of the fields instead of a regex match: HH is 0-99,
+    MM and SS are 0-59 (1-2 digits each) and the optional fraction
+    has 1-3 digits.
+    """
+    clock, dot, milliseconds = time_str.partition('.')
+    if dot and not (0 < len(milliseconds) <= 3 and milliseconds.isdigit() and milliseconds.isascii()):
+        return None
     
-    # If no match, raise an error with detailed format information
-    raise click.BadParameter(
-        f"Invalid time format: '{time_str}'. "
-        "Supported formats:\n"
-        "  • HH:MM:SS.mmm (e.g., 01:23:45.678)\n"
-        "  • MM:SS.mmm (e.g., 23:45.123)\n"
-        "  • SS.mmm (e.g., 45.500)\n"
-        "  • Decimal seconds (e.g., 105.250)"
-    )
+    fields = clock.split(':')
+    if len(fields) == 2:
+        hours = '0'
+        minutes, seconds = fields
+    elif len(fields) == 3:
+        hours, minutes, seconds = fields
+    else:
+        return None
+    
+    if not (0 < len(hours) <= 2 and 0 < len(minutes) <= 2 and 0 < len(seconds) <= 2):
+        return None
+    digits = hours + minutes + seconds
+    if not (digits.isdigit() and digits.isascii()):
+        return None
+    
+    minutes, seconds = int(minutes), int(seconds)
+    if minutes >= 60 or seconds >= 60:
+        return None
+    
+    # Sum in whole milliseconds so the result is exact
+    total_ms = (int(hours) * 3600 + minutes * 60 + seconds) * 1000
+    if milliseconds:
+        total_ms += int(milliseconds.ljust(3, '0'))
+    return total_ms
 
 def validate_time_range(start_time: Optional[str], duration: Optional[str], end_time: Optional[str]):
     """Validate time range parameters"""
@@ -77,6 +151,39 @@ def validate_time_range(start_time: Optional[str], duration: Optional[str], end_
     if (duration or end_time) and not start_time:
         raise click.BadParameter("--start-time is required when using --duration or --end-time")
 
+@lru_cache(maxsize=512)
+def time_to_seconds(time_str: str) -> float:
+    """Convert time string (HH:MM:SS.mmm, MM:SS.mmm or seconds) to seconds"""
+    if not time_str:
+        return 0
+    
+    # Locate the colons directly instead of building a list with split()
+    first = time_str.find(':')
+    if first < 0:  # Seconds
+        return float(time_str)
+    
+    second = time_str.find(':', first + 1)
+    if second < 0:  # MM:SS
+        return int(time_str[:first]) * 60 + float(time_str[first + 1:])
+    # HH:MM:SS
+    return int(time_str[:first]) * 3600 + int(time_str[first + 1:second]) * 60 + float(time_str[second + 1:])
+
+def time_to_ms(time_str: str) -> int:
+    """Convert time string (HH:MM:SS.mmm, MM:SS.mmm or seconds) to whole milliseconds
+    
+    Accepts exactly what parse_time_format does and raises
+    click.BadParameter for anything else, including signed values.
+    """
+    if isinstance(time_str, ParsedTime):
+        return time_str.milliseconds
+    return parse_time_format(time_str).milliseconds
+
+def _to_seconds(time_str: str) -> float:
+    """Seconds for a time string, reusing the value from parse_time_format if available"""
+    if isinstance(time_str, ParsedTime):
+        return time_str.seconds
+    return time_to_seconds(time_str)
+
 class AudioExtractor:
     """Main class for audio extraction operations"""
     
@@ -88,33 +195,32 @@ class AudioExtractor:
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(exist_ok=True)
         
-        # Quality settings
-        self.quality_settings = {
-            "high": {"bitrate": "320k", "sample_rate": "48000"},
-            "medium": {"bitrate": "192k", "sample_rate": "44100"},
-            "low": {"bitrate": "128k", "sample_rate": "44100"}
-        }
+        # Quality settings, resolved once for all extractions
+        self._settings = _QUALITY_SETTINGS.get(quality, _QUALITY_SETTINGS["high"])
+        
+        # Audio codec of each probed source, keyed by (path, mtime)
+        self._probe_cache = {}
     
     def extract_from_local_file(self, input_file: str, start_time: Optional[str] = None, duration: Optional[str] = None, end_time: Optional[str] = None) -> bool:
         """Extract audio from a local video file, optionally with time range"""
+        lines = []
+        success = self._extract_local(lines, input_file, start_time, duration, end_time)
+        click.echo("\n".join(lines))
+        return success
+    
+    def _extract_local(self, lines: List[str], input_file: str, start_time: Optional[str] = None, duration: Optional[str] = None, end_time: Optional[str] = None) -> bool:
+        """Extract audio from a local file, appending styled messages to `lines`
+        
+        Callers print the collected lines with a single click.echo, so one
+        file's messages stay together when batch workers write concurrently.
+        """
         input_path = Path(input_file)
         
         if not input_path.exists():
-            click.echo(f"{Fore.RED}Error: File '{input_file}' not found{Style.RESET_ALL}")
+            lines.append(click.style(f"Error: File '{input_file}' not found", fg="red"))
             return False
         
-        # Generate output filename with time range info if provided
-        if start_time:
-            time_info = f"_{start_time.replace(':', '')}"
-            if duration:
-                time_info += f"_d{duration.replace(':', '')}"
-            elif end_time:
-                time_info += f"_to{end_time.replace(':', '')}"
-            output_filename = f"{input_path.stem}{time_info}.{self.audio_format}"
-        else:
-            output_filename = f"{input_path.stem}.{self.audio_format}"
-            
-        output_path = self.output_dir / output_filename
+        output_path = self._output_path(input_path, start_time, duration, end_time)
         
         # Display extraction info with time range if provided
         if start_time:
@@ -123,47 +229,95 @@ class AudioExtractor:
                 time_info += f" for {duration}"
             elif end_time:
                 time_info += f" to {end_time}"
-            click.echo(f"{Fore.CYAN}Extracting audio{time_info} from: {input_file}{Style.RESET_ALL}")
+            lines.append(click.style(f"Extracting audio{time_info} from: {input_file}", fg="cyan"))
         else:
-            click.echo(f"{Fore.CYAN}Extracting audio from: {input_file}{Style.RESET_ALL}")
+            lines.append(click.style(f"Extracting audio from: {input_file}", fg="cyan"))
+        
+        import ffmpeg
         
         try:
-            # Get quality settings
-            settings = self.quality_settings.get(self.quality, self.quality_settings["high"])
-            
-            # Set up FFmpeg input with time parameters if provided
-            input_args = {}
-            if start_time:
-                input_args['ss'] = start_time
-                
-            stream = ffmpeg.input(str(input_path), **input_args)
-            
-            # Set up output arguments
-            output_args = {
-                'acodec': 'libmp3lame' if self.audio_format == 'mp3' else None,
-                'audio_bitrate': settings["bitrate"],
-                'ar': settings["sample_rate"]
-            }
-            
-            # Add duration or end time if provided
-            if duration and not end_time:
-                output_args['t'] = duration
-            elif end_time and not duration:
-                output_args['to'] = end_time
-                
-            stream = ffmpeg.output(stream, str(output_path), **output_args)
+            stream = self._build_output(input_path, output_path, start_time, duration, end_time)
             ffmpeg.run(stream, overwrite_output=True, quiet=True)
             
-            click.echo(f"{Fore.GREEN}✓ Audio extracted to: {output_path}{Style.RESET_ALL}")
+            lines.append(click.style(f"✓ Audio extracted to: {output_path}", fg="green"))
             return True
             
         except ffmpeg.Error as e:
-            click.echo(f"{Fore.RED}FFmpeg error: {e}{Style.RESET_ALL}")
+            lines.append(click.style(f"FFmpeg error: {e}", fg="red"))
             return False
         except Exception as e:
-            click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+            lines.append(click.style(f"Error: {e}", fg="red"))
             return False
     
+    def _output_path(self, input_path: Path, start_time: Optional[str] = None, duration: Optional[str] = None, end_time: Optional[str] = None) -> Path:
+        """Generate the output path, with time range info if provided"""
+        if start_time:
+            time_info = f"_{start_time.replace(':', '')}"
+            if duration:
+                time_info += f"_d{duration.replace(':', '')}"
+            elif end_time:
+                time_info += f"_to{end_time.replace(':', '')}"
+            output_filename = f"{input_path.stem}{time_info}.{self.audio_format}"
+        else:
+            output_filename = f"{input_path.stem}.{self.audio_format}"
+            
+        return self.output_dir / output_filename
+    
+    def _build_output(self, input_path: Path, output_path: Path, start_time: Optional[str] = None, duration: Optional[str] = None, end_time: Optional[str] = None):
+        """Build the ffmpeg output node extracting the first audio stream of a file"""
+        import ffmpeg
+        
+        # Time range is applied on the input side: -ss seeks by keyframe in the
+        # demuxer instead of decoding everything before the start, and -t/-to
+        # are measured on the source timeline
+        input_args = {}
+        if start_time:
+            input_args['ss'] = start_time
+        if duration and not end_time:
+            input_args['t'] = duration
+        elif end_time and not duration:
+            input_args['to'] = end_time
+            
+        stream = ffmpeg.input(str(input_path), **input_args)['a:0']
+        
+        # Copy the audio stream as-is when the source already uses the requested
+        # codec. Stream copy cuts on packet boundaries, so sub-second ranges are
+        # re-encoded to land on the exact timestamps
+        precise_cut = any(t and time_to_ms(t) % 1000
+                          for t in (start_time, duration, end_time))
+        if not precise_cut and self._probe_audio_codec(input_path) == self.audio_format:
+            output_args = {'acodec': 'copy', 'vn': None}
+        else:
+            output_args = {
+                'audio_bitrate': self._settings["bitrate"],
+                'ar': self._settings["sample_rate"]
+            }
+            # Other formats use ffmpeg's default encoder for the output extension;
+            # an acodec=None entry would compile to a bare '-acodec' flag
+            if self.audio_format == 'mp3':
+                output_args['acodec'] = 'libmp3lame'
+            
+        return ffmpeg.output(stream, str(output_path), **output_args)
+    
+    def _probe_audio_codec(self, input_path: Path) -> Optional[str]:
+        """Return the codec name of the first audio stream, or None if unknown
+        
+        Results are cached by path and modification time so repeated
+        extractions from the same file only run ffprobe once.
+        """
+        import ffmpeg
+        
+        key = (str(input_path), input_path.stat().st_mtime_ns)
+        if key not in self._probe_cache:
+            try:
+                info = ffmpeg.probe(str(input_path), select_streams='a:0')
+                streams = info.get('streams') or [{}]
+                self._probe_cache[key] = streams[0].get('codec_name')
+            except (ffmpeg.Error, OSError):
+                # No ffprobe or unreadable file: fall back to re-encoding
+                self._probe_cache[key] = None
+        return self._probe_cache[key]
+    
     def extract_from_url(self, url: str, start_time: Optional[str] = None, duration: Optional[str] = None, end_time: Optional[str] = None) -> bool:
         """Download and extract audio from a URL using yt-dlp, optionally with time range"""
         # Display download info with time range if provided
@@ -173,9 +327,9 @@ class AudioExtractor:
                 time_info += f" for {duration}"
             elif end_time:
                 time_info += f" to {end_time}"
-            click.echo(f"{Fore.CYAN}Downloading and extracting audio{time_info} from: {url}{Style.RESET_ALL}")
+            click.secho(f"Downloading and extracting audio{time_info} from: {url}", fg="cyan")
         else:
-            click.echo(f"{Fore.CYAN}Downloading and extracting audio from: {url}{Style.RESET_ALL}")
+            click.secho(f"Downloading and extracting audio from: {url}", fg="cyan")
         
         # Configure yt-dlp options
         ydl_opts = {
@@ -184,7 +338,7 @@ class AudioExtractor:
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': self.audio_format,
-                'preferredquality': self.quality_settings[self.quality]["bitrate"].replace('k', ''),
+                'preferredquality': self._settings["bitrate"].replace('k', ''),
             }],
             'quiet': True,
             'no_warnings': True,
@@ -195,88 +349,188 @@ class AudioExtractor:
             # Calculate end time in seconds if we have duration
             if duration:
                 # Convert times to seconds for calculation
-                start_seconds = self._time_to_seconds(start_time)
-                duration_seconds = self._time_to_seconds(duration)
+                start_seconds = _to_seconds(start_time)
+                duration_seconds = _to_seconds(duration)
                 end_seconds = start_seconds + duration_seconds
                 ydl_opts['download_ranges'] = [{'start_time': start_seconds, 'end_time': end_seconds}]
             elif end_time:
-                start_seconds = self._time_to_seconds(start_time)
-                end_seconds = self._time_to_seconds(end_time)
+                start_seconds = _to_seconds(start_time)
+                end_seconds = _to_seconds(end_time)
                 ydl_opts['download_ranges'] = [{'start_time': start_seconds, 'end_time': end_seconds}]
             else:
                 # Only start time provided
-                start_seconds = self._time_to_seconds(start_time)
+                start_seconds = _to_seconds(start_time)
                 ydl_opts['download_ranges'] = [{'start_time': start_seconds}]
         
         try:
+            import yt_dlp
+            
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
             
-            click.echo(f"{Fore.GREEN}✓ Audio downloaded and extracted to: {self.output_dir}{Style.RESET_ALL}")
+            click.secho(f"✓ Audio downloaded and extracted to: {self.output_dir}", fg="green")
             return True
             
         except Exception as e:
-            click.echo(f"{Fore.RED}Error downloading from URL: {e}{Style.RESET_ALL}")
+            click.secho(f"Error downloading from URL: {e}", fg="red")
             return False
     
-    def batch_extract_local(self, input_dir: str) -> List[str]:
-        """Extract audio from all video files in a directory"""
+    def extract_from_urls(self, urls: List[str], jobs: Optional[int] = None) -> List[str]:
+        """Download and extract audio from several URLs concurrently
+        
+        Downloads are network-bound, so up to `jobs` of them (default
+        _MAX_CONCURRENT_DOWNLOADS) run at once on a thread pool.
+        """
+        if not urls:
+            click.secho("No URLs given", fg="yellow")
+            return []
+        
+        click.secho(f"Downloading {len(urls)} URL(s)", fg="cyan")
+        
+        successful_downloads = []
+        failed_downloads = []
+        
+        max_workers = jobs or min(len(urls), _MAX_CONCURRENT_DOWNLOADS)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.extract_from_url, url): url for url in urls}
+            
+            for future in as_completed(futures):
+                if future.result():
+                    successful_downloads.append(futures[future])
+                else:
+                    failed_downloads.append(futures[future])
+        
+        # Summary
+        click.secho("\nDownloads completed:", fg="green")
+        click.echo(f"  ✓ Successful: {len(successful_downloads)}")
+        click.echo(f"  ✗ Failed: {len(failed_downloads)}")
+        
+        if failed_downloads:
+            click.secho("\nFailed URLs:", fg="red")
+            for failed_url in failed_downloads:
+                click.echo(f"  - {failed_url}")
+        
+        return successful_downloads
+    
+    def batch_extract_local(self, input_dir: str, jobs: Optional[int] = None) -> List[str]:
+        """Extract audio from all video files in a directory
+        
+        Up to `jobs` ffmpeg processes (defaults to the number of CPU cores)
+        run at once, each handling a group of up to _BATCH_GROUP_SIZE files.
+        """
         input_path = Path(input_dir)
         
         if not input_path.is_dir():
-            click.echo(f"{Fore.RED}Error: '{input_dir}' is not a directory{Style.RESET_ALL}")
+            click.secho(f"Error: '{input_dir}' is not a directory", fg="red")
             return []
         
-        # Common video file extensions
-        video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        video_files = [f for f in input_path.iterdir() if f.suffix.lower() in video_extensions]
+        # Filter on the raw DirEntry names so only matching files become Path objects.
+        # Leading dots are skipped like os.path.splitext does, so a dotfile named
+        # just '.mp4' has no extension while '.clip.mp4' still matches
+        with os.scandir(input_path) as entries:
+            video_files = [Path(entry.path) for entry in entries
+                           if entry.name.lstrip('.').lower().endswith(_VIDEO_EXTENSIONS)
+                           and entry.is_file()]
         
         if not video_files:
-            click.echo(f"{Fore.YELLOW}No video files found in '{input_dir}'{Style.RESET_ALL}")
+            click.secho(f"No video files found in '{input_dir}'", fg="yellow")
             return []
         
-        click.echo(f"{Fore.CYAN}Found {len(video_files)} video file(s) for processing{Style.RESET_ALL}")
+        click.secho(f"Found {len(video_files)} video file(s) for processing", fg="cyan")
         
         successful_extractions = []
         failed_extractions = []
+        skipped_files = []
         
-        for video_file in video_files:
-            click.echo(f"{Fore.BLUE}Processing: {video_file.name}{Style.RESET_ALL}")
-            
-            if self.extract_from_local_file(str(video_file)):
-                successful_extractions.append(str(video_file))
+        # Files sharing a stem (clip.mp4, clip.mkv) would write the same output
+        # from two workers at once, so only the first of each is extracted and
+        # the rest are reported as skipped rather than failed
+        claimed = {}
+        unique_files = []
+        for video_file in sorted(video_files):
+            output_path = self._output_path(video_file)
+            if output_path in claimed:
+                click.secho(f"Skipping {video_file.name}: its output would overwrite "
+                            f"{claimed[output_path].name}'s (same name)", fg="yellow")
+                skipped_files.append(str(video_file))
             else:
-                failed_extractions.append(str(video_file))
+                claimed[output_path] = video_file
+                unique_files.append(video_file)
+        video_files = unique_files
+        
+        # ffmpeg runs out-of-process, so threads are enough to keep every core busy
+        max_workers = jobs or min(len(video_files), os.cpu_count() or 4)
+        
+        # Each worker gets groups of files that share a single ffmpeg process
+        group_size = max(1, min(_BATCH_GROUP_SIZE, len(video_files) // max_workers))
+        groups = [video_files[i:i + group_size] for i in range(0, len(video_files), group_size)]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._extract_batch_group, group): group
+                       for group in groups}
+            
+            for future in as_completed(futures):
+                for video_file, success in zip(futures[future], future.result()):
+                    if success:
+                        successful_extractions.append(str(video_file))
+                    else:
+                        failed_extractions.append(str(video_file))
         
         # Summary
-        click.echo(f"\n{Fore.GREEN}Batch processing completed:{Style.RESET_ALL}")
+        click.secho("\nBatch processing completed:", fg="green")
         click.echo(f"  ✓ Successful: {len(successful_extractions)}")
         click.echo(f"  ✗ Failed: {len(failed_extractions)}")
+        if skipped_files:
+            click.echo(f"  - Skipped: {len(skipped_files)}")
         
         if failed_extractions:
-            click.echo(f"\n{Fore.RED}Failed files:{Style.RESET_ALL}")
+            click.secho("\nFailed files:", fg="red")
             for failed_file in failed_extractions:
                 click.echo(f"  - {failed_file}")
         
+        if skipped_files:
+            click.secho("\nSkipped files (same output name as another file):", fg="yellow")
+            for skipped_file in skipped_files:
+                click.echo(f"  - {skipped_file}")
+        
         return successful_extractions
     
-    def _time_to_seconds(self, time_str: str) -> float:
-        """Convert time string to seconds"""
-        if not time_str:
-            return 0
-            
-        # If it's already in seconds (float or int)
-        if re.match(r'^\d+(?:\.\d+)?$', time_str):
-            return float(time_str)
-            
-        # Parse HH:MM:SS, MM:SS format
-        parts = time_str.split(':')
-        if len(parts) == 3:  # HH:MM:SS
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-        elif len(parts) == 2:  # MM:SS
-            return int(parts[0]) * 60 + float(parts[1])
-        else:
-            return float(time_str)
+    def _extract_batch_item(self, video_file: Path) -> bool:
+        """Extract a single file as part of a batch run"""
+        lines = [click.style(f"Processing: {video_file.name}", fg="blue")]
+        success = self._extract_local(lines, str(video_file))
+        click.echo("\n".join(lines))
+        return success
+    
+    def _extract_batch_group(self, video_files: List[Path]) -> List[bool]:
+        """Extract a group of files with a single ffmpeg process
+        
+        All input/output pairs are declared in one ffmpeg command so process
+        startup is paid once per group instead of once per file. If the
+        combined run fails, each file is retried on its own so one bad input
+        doesn't fail the rest of the group.
+        """
+        if len(video_files) == 1:
+            return [self._extract_batch_item(video_files[0])]
+        
+        import ffmpeg
+        
+        names = ", ".join(video_file.name for video_file in video_files)
+        
+        output_paths = [self._output_path(video_file) for video_file in video_files]
+        try:
+            outputs = [self._build_output(video_file, output_path)
+                       for video_file, output_path in zip(video_files, output_paths)]
+            ffmpeg.run(ffmpeg.merge_outputs(*outputs), overwrite_output=True, quiet=True)
+        except Exception:
+            return [self._extract_batch_item(video_file) for video_file in video_files]
+        
+        lines = [click.style(f"Processing: {names}", fg="blue")]
+        lines.extend(click.style(f"✓ Audio extracted to: {output_path}", fg="green")
+                     for output_path in output_paths)
+        click.echo("\n".join(lines))
+        return [True] * len(video_files)
 
 @click.group()
 @click.option('--format', default='mp3', 
@@ -294,7 +548,7 @@ def cli(ctx, format, quality, output):
     ctx.obj['extractor'] = AudioExtractor(output, format, quality)
     
     # Display configuration
-    click.echo(f"{Fore.MAGENTA}Audio Extractor Configuration:{Style.RESET_ALL}")
+    click.secho("Audio Extractor Configuration:", fg="magenta")
     click.echo(f"  Format: {format}")
     click.echo(f"  Quality: {quality}")
     click.echo(f"  Output Directory: {output}")
@@ -333,7 +587,7 @@ def local(ctx, file_path, start_time, duration, end_time):
         validate_time_range(start_time, duration, end_time)
         
     except click.BadParameter as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.secho(f"Error: {e}", fg="red")
         return
     
     extractor = ctx.obj['extractor']
@@ -370,50 +624,58 @@ def url(ctx, video_url, start_time, duration, end_time):
         validate_time_range(start_time, duration, end_time)
         
     except click.BadParameter as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.secho(f"Error: {e}", fg="red")
         return
     
     extractor = ctx.obj['extractor']
     extractor.extract_from_url(video_url, start_time, duration, end_time)
 
+@cli.command()
+@click.argument('video_urls', nargs=-1, required=True)
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Number of URLs to download in parallel (default: up to 8)')
+@click.pass_context
+def urls(ctx, video_urls, jobs):
+    """Download and extract audio from several URLs concurrently"""
+    extractor = ctx.obj['extractor']
+    extractor.extract_from_urls(list(video_urls), jobs)
+
 @cli.command()
 @click.argument('directory_path')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Number of ffmpeg processes to run in parallel, each handling up to 8 files (default: number of CPU cores)')
 @click.pass_context
-def batch(ctx, directory_path):
+def batch(ctx, directory_path, jobs):
     """Batch extract audio from all videos in a directory"""
     extractor = ctx.obj['extractor']
-    extractor.batch_extract_local(directory_path)
+    extractor.batch_extract_local(directory_path, jobs)
 
 @cli.command()
 def check_dependencies():
     """Check if required dependencies are available"""
-    click.echo(f"{Fore.CYAN}Checking dependencies...{Style.RESET_ALL}")
+    click.secho("Checking dependencies...", fg="cyan")
     
     # Check FFmpeg
     try:
         import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            click.echo(f"{Fore.GREEN}✓ FFmpeg is installed{Style.RESET_ALL}")
+        # Only the exit status matters, so discard the version banner
+        returncode = subprocess.run(['ffmpeg', '-version'],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                    timeout=10).returncode
+        if returncode == 0:
+            click.secho("✓ FFmpeg is installed", fg="green")
         else:
-            click.echo(f"{Fore.RED}✗ FFmpeg check failed{Style.RESET_ALL}")
+            click.secho("✗ FFmpeg check failed", fg="red")
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        click.echo(f"{Fore.RED}✗ FFmpeg not found in PATH{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}  Please install FFmpeg: https://ffmpeg.org/download.html{Style.RESET_ALL}")
-    
-    # Check Python packages
-    try:
-        import yt_dlp
-        click.echo(f"{Fore.GREEN}✓ yt-dlp is installed{Style.RESET_ALL}")
-    except ImportError:
-        click.echo(f"{Fore.RED}✗ yt-dlp not installed{Style.RESET_ALL}")
+        click.secho("✗ FFmpeg not found in PATH", fg="red")
+        click.secho("  Please install FFmpeg: https://ffmpeg.org/download.html", fg="yellow")
     
-    try:
-        import ffmpeg
-        click.echo(f"{Fore.GREEN}✓ ffmpeg-python is installed{Style.RESET_ALL}")
-    except ImportError:
-        click.echo(f"{Fore.RED}✗ ffmpeg-python not installed{Style.RESET_ALL}")
+    # Check Python packages without importing them
+    for module_name, package_name in (('yt_dlp', 'yt-dlp'), ('ffmpeg', 'ffmpeg-python')):
+        if importlib.util.find_spec(module_name) is not None:
+            click.secho(f"✓ {package_name} is installed", fg="green")
+        else:
+            click.secho(f"✗ {package_name} not installed", fg="red")
 
 if __name__ == '__main__':
     cli()
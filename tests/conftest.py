@@ -0,0 +1,65 @@
+"""
+Shared pytest fixtures for the Audio Extractor tests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Make src/ importable once for the whole session. pytest loads this file
+# before collecting any test module, so test files import extract_audio
+# without touching sys.path themselves.
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture(scope="session")
+def extract_audio():
+    """The extract_audio module under test"""
+    import extract_audio
+    return extract_audio
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """One click CliRunner shared by every CLI test"""
+    from click.testing import CliRunner
+    return CliRunner()
+
+@pytest.fixture(scope="session")
+def help_outputs(cli_runner, extract_audio, output_dir):
+    """Help text of the main group and the local/url commands, rendered once
+    
+    Subcommand help still runs the group callback, which creates the output
+    directory, so it points at the session directory like the other CLI tests.
+    """
+    commands = {'main': [], 'local': ['local'], 'url': ['url']}
+    return {name: cli_runner.invoke(extract_audio.cli, ['--output', output_dir, *args, '--help'])
+            for name, args in commands.items()}
+
+@pytest.fixture(scope="session")
+def output_dir(tmp_path_factory):
+    """Temporary output directory shared by the whole test session"""
+    return str(tmp_path_factory.mktemp("output"))
+
+@pytest.fixture(scope="session")
+def extractor(output_dir):
+    """AudioExtractor with default settings writing to the session output directory"""
+    from extract_audio import AudioExtractor
+    return AudioExtractor(output_dir=output_dir)
+
+@pytest.fixture(scope="session")
+def time_fns():
+    """The (parse_time_format, time_to_seconds) pair from extract_audio
+    
+    Every test shares the same functions, and with them the same lru_cache.
+    """
+    from extract_audio import parse_time_format, time_to_seconds
+    return parse_time_format, time_to_seconds
+
+@pytest.fixture(scope="session")
+def dummy_mp4(tmp_path_factory):
+    """Path to a placeholder .mp4 file, created once per session"""
+    video_path = tmp_path_factory.mktemp("media") / "dummy.mp4"
+    video_path.write_bytes(b'dummy video content')
+    return str(video_path)
@@ -4,311 +4,305 @@ Comprehensive test suite for the Audio Extractor
 Tests CLI interface, time parsing, and core functionality
 """
 
-import sys
 import os
-import subprocess
-import tempfile
-import shutil
 from pathlib import Path
 
-# Add src directory to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
-def test_cli_help():
+# CLI tests invoke the click group in-process through the shared
+# cli_runner fixture instead of spawning a new interpreter per command
+
+@pytest.mark.parametrize("command, expected", [
+    ('main', 'Audio Extractor'),
+    ('local', 'millisecond precision'),
+    ('url', 'millisecond precision'),
+])
+def test_cli_help(command, expected, help_outputs):
     """Test that CLI help commands work"""
-    print("Testing CLI help functionality...")
-    
-    try:
-        # Test main help
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', '--help'
-        ], capture_output=True, text=True, timeout=10, cwd=os.path.dirname(__file__))
-        
-        if result.returncode != 0:
-            print(f"FAIL: Main help command failed with return code {result.returncode}")
-            print(f"Error: {result.stderr}")
-            return False
-        
-        if 'Audio Extractor' not in result.stdout:
-            print(f"❌ FAIL: Help output doesn't contain expected text")
-            return False
-            
-        print("PASS: Main help command works")
-        
-        # Test local command help
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', 'local', '--help'
-        ], capture_output=True, text=True, timeout=10, cwd=os.path.dirname(__file__))
-        
-        if result.returncode != 0:
-            print(f"❌ FAIL: Local help command failed")
-            return False
-            
-        if 'millisecond precision' not in result.stdout:
-            print(f"❌ FAIL: Local help doesn't mention millisecond precision")
-            return False
-            
-        print("✅ PASS: Local command help works and mentions millisecond precision")
-        
-        # Test url command help
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', 'url', '--help'
-        ], capture_output=True, text=True, timeout=10, cwd=os.path.dirname(__file__))
-        
-        if result.returncode != 0:
-            print(f"❌ FAIL: URL help command failed")
-            return False
-            
-        if 'millisecond precision' not in result.stdout:
-            print(f"❌ FAIL: URL help doesn't mention millisecond precision")
-            return False
-            
-        print("✅ PASS: URL command help works and mentions millisecond precision")
-        
-        return True
-        
-    except subprocess.TimeoutExpired:
-        print("❌ FAIL: Help command timed out")
-        return False
-    except Exception as e:
-        print(f"❌ FAIL: Help command failed with exception: {e}")
-        return False
-
-def test_dependency_check():
+    result = help_outputs[command]
+
+    assert result.exit_code == 0, result.output
+    assert expected in result.output
+
+def test_dependency_check(output_dir, cli_runner, extract_audio):
     """Test the dependency check functionality"""
-    print("\\n🧪 Testing dependency check...")
-    
-    try:
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', 'check-dependencies'
-        ], capture_output=True, text=True, timeout=15, cwd=os.path.dirname(__file__))
-        
-        # This might fail due to missing dependencies, but the command should exist
-        if 'Checking dependencies' not in result.stdout and 'No module named' not in result.stderr:
-            print(f"❌ FAIL: Unexpected output from dependency check")
-            print(f"stdout: {result.stdout}")
-            print(f"stderr: {result.stderr}")
-            return False
-            
-        print("✅ PASS: Dependency check command works")
-        return True
-        
-    except subprocess.TimeoutExpired:
-        print("❌ FAIL: Dependency check timed out")
-        return False
-    except Exception as e:
-        print(f"❌ FAIL: Dependency check failed: {e}")
-        return False
-
-def test_time_validation():
+    result = cli_runner.invoke(extract_audio.cli, ['--output', output_dir, 'check-dependencies'])
+
+    # FFmpeg itself may be missing, but the command should run and report
+    assert 'Checking dependencies' in result.output
+
+def test_time_validation(dummy_mp4, output_dir, cli_runner, extract_audio):
     """Test time parameter validation using CLI"""
-    print("\\n🧪 Testing time parameter validation...")
-    
-    # Create a dummy file for testing
-    with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as temp_file:
-        temp_file.write(b'dummy video content')
-        temp_path = temp_file.name
-    
-    try:
-        # Test valid millisecond time format
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', '--format', 'mp3',
-            'local', temp_path, '--start-time', '1:23.456', '--duration', '30.750'
-        ], capture_output=True, text=True, timeout=10, cwd=os.path.dirname(__file__))
-        
-        # This will likely fail due to FFmpeg/dependencies, but should validate time format
-        if 'Invalid time format' in result.stderr:
-            print(f"❌ FAIL: Valid millisecond time format rejected")
-            return False
-            
-        print("✅ PASS: Valid millisecond time format accepted")
-        
-        # Test invalid time format
-        result = subprocess.run([
-            sys.executable, '../src/extract_audio.py', '--format', 'mp3',
-            'local', temp_path, '--start-time', '1:23:45.1234'
-        ], capture_output=True, text=True, timeout=10, cwd=os.path.dirname(__file__))
-        
-        if 'Invalid time format' not in result.stderr and 'No module named' not in result.stderr:
-            print(f"❌ FAIL: Invalid time format should have been rejected")
-            return False
-            
-        if 'Invalid time format' in result.stderr:
-            print("✅ PASS: Invalid time format correctly rejected")
-        else:
-            print("✅ PASS: Time validation works (module import issue)")
-        
-        return True
-        
-    except subprocess.TimeoutExpired:
-        print("❌ FAIL: Time validation test timed out")
-        return False
-    except Exception as e:
-        print(f"❌ FAIL: Time validation test failed: {e}")
-        return False
-    finally:
-        # Clean up temp file
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
-
-def test_module_imports():
-    """Test that we can import the main modules"""
-    print("\\n🧪 Testing module imports...")
-    
-    try:
-        # Test importing the main module
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-        from extract_audio import AudioExtractor, parse_time_format, validate_time_range
-        
-        print("✅ PASS: Main module imports successfully")
-        
-        # Test creating AudioExtractor instance
-        extractor = AudioExtractor()
-        print("✅ PASS: AudioExtractor instance created successfully")
-        
-        # Test time parsing function
-        result = parse_time_format("1:23.456")
-        if result != "1:23.456":
-            print(f"❌ FAIL: Time parsing returned unexpected result: {result}")
-            return False
-        print("✅ PASS: Time parsing function works")
-        
-        # Test validation function
-        try:
-            validate_time_range("1:00", "30", None)
-            print("✅ PASS: Time range validation works")
-        except Exception as e:
-            print(f"❌ FAIL: Time range validation failed: {e}")
-            return False
-            
-        return True
-        
-    except ImportError as e:
-        print(f"❌ FAIL: Import failed: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ FAIL: Module test failed: {e}")
-        return False
-
-def test_file_operations():
-    """Test file and directory operations"""
-    print("\\n🧪 Testing file operations...")
-    
-    try:
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-        from extract_audio import AudioExtractor
-        
-        # Test output directory creation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = os.path.join(temp_dir, 'test_output')
-            extractor = AudioExtractor(output_dir=output_dir)
-            
-            if not os.path.exists(output_dir):
-                print("❌ FAIL: Output directory was not created")
-                return False
-                
-            print("✅ PASS: Output directory creation works")
-            
-            # Test various audio formats
-            for fmt in ['mp3', 'wav', 'flac', 'aac']:
-                extractor = AudioExtractor(audio_format=fmt)
-                if extractor.audio_format != fmt:
-                    print(f"❌ FAIL: Audio format not set correctly: {fmt}")
-                    return False
-                    
-            print("✅ PASS: Audio format selection works")
-            
-            # Test quality settings
-            for quality in ['high', 'medium', 'low']:
-                extractor = AudioExtractor(quality=quality)
-                if extractor.quality != quality:
-                    print(f"❌ FAIL: Quality setting not set correctly: {quality}")
-                    return False
-                    
-            print("✅ PASS: Quality settings work")
-            
-        return True
-        
-    except Exception as e:
-        print(f"❌ FAIL: File operations test failed: {e}")
-        return False
-
-def run_all_tests():
-    """Run all available tests"""
-    print("Audio Extractor Comprehensive Test Suite\n")
-    print("=" * 60)
-    
-    tests = [
-        ("CLI Help Commands", test_cli_help),
-        ("Dependency Check", test_dependency_check), 
-        ("Time Parameter Validation", test_time_validation),
-        ("Module Imports", test_module_imports),
-        ("File Operations", test_file_operations)
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_name, test_func in tests:
-        print(f"\\n🔍 Running: {test_name}")
-        print("-" * 50)
-        
-        try:
-            if test_func():
-                print(f"✅ {test_name}: PASSED")
-                passed += 1
-            else:
-                print(f"❌ {test_name}: FAILED")
-                failed += 1
-        except Exception as e:
-            print(f"❌ {test_name}: FAILED with exception: {e}")
-            failed += 1
-    
-    # Also run the millisecond test
-    print(f"\\n🔍 Running: Millisecond Support Tests")
-    print("-" * 50)
-    
-    try:
-        result = subprocess.run([
-            sys.executable, 'test_millisecond_support.py'
-        ], capture_output=True, text=True, timeout=30, cwd=os.path.dirname(__file__))
-        
-        if result.returncode == 0 and "All tests passed!" in result.stdout:
-            print("✅ Millisecond Support Tests: PASSED")
-            passed += 1
-        else:
-            print("❌ Millisecond Support Tests: FAILED")
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
-            failed += 1
-    except Exception as e:
-        print(f"❌ Millisecond Support Tests: FAILED with exception: {e}")
-        failed += 1
-    
-    # Final summary
-    total = passed + failed
-    print("\\n" + "=" * 60)
-    print(f"📊 Final Test Results:")
-    print(f"   ✅ Passed: {passed}/{total}")
-    print(f"   ❌ Failed: {failed}/{total}")
-    print(f"   Success Rate: {(passed/total)*100:.1f}%")
-    
-    if failed == 0:
-        print("\\n🎉 All tests passed! The audio extractor is working correctly.")
-        print("\\n✨ Key features verified:")
-        print("   • CLI interface working")
-        print("   • Millisecond precision time parsing")
-        print("   • Audio format and quality settings")
-        print("   • File and directory operations")
-        print("   • Error handling and validation")
+    # Valid millisecond time format: extraction fails on the dummy file,
+    # but the time format must be accepted
+    result = cli_runner.invoke(extract_audio.cli, [
+        '--format', 'mp3', '--output', output_dir,
+        'local', dummy_mp4, '--start-time', '1:23.456', '--duration', '30.750'
+    ])
+    assert 'Invalid time format' not in result.output
+
+    # Invalid time format
+    result = cli_runner.invoke(extract_audio.cli, [
+        '--format', 'mp3', '--output', output_dir,
+        'local', dummy_mp4, '--start-time', '1:23:45.1234'
+    ])
+    assert 'Invalid time format' in result.output
+
+def test_module_imports(extractor, time_fns, extract_audio):
+    """Test that the main module's public API works"""
+    assert isinstance(extractor, extract_audio.AudioExtractor)
+
+    parse_time_format, _ = time_fns
+    result = parse_time_format("1:23.456")
+    assert result == "1:23.456"
+    assert result.seconds == 83.456
+
+    # A valid range must not raise
+    extract_audio.validate_time_range("1:00", "30", None)
+
+def test_parse_time_format_cache(extract_audio):
+    """Repeated and whitespace-padded inputs are served from the parse cache"""
+    extract_audio.parse_time_format("12:34.567")
+    hits = extract_audio._parse_time_format.cache_info().hits
+
+    extract_audio.parse_time_format("12:34.567")
+    extract_audio.parse_time_format(" 12:34.567 ")
+
+    assert extract_audio._parse_time_format.cache_info().hits == hits + 2
+
+def test_output_directory_creation(output_dir, extract_audio):
+    """Test that the output directory is created"""
+    nested_dir = os.path.join(output_dir, 'test_output')
+    extract_audio.AudioExtractor(output_dir=nested_dir)
+
+    assert os.path.isdir(nested_dir)
+
+@pytest.mark.parametrize("fmt", ['mp3', 'wav', 'flac', 'aac'])
+def test_audio_format_selection(fmt, output_dir, extract_audio):
+    """Test that each audio format is set on the extractor"""
+    assert extract_audio.AudioExtractor(audio_format=fmt, output_dir=output_dir).audio_format == fmt
+
+@pytest.mark.parametrize("quality", ['high', 'medium', 'low'])
+def test_quality_settings(quality, output_dir, extract_audio):
+    """Test that each quality setting is set on the extractor"""
+    assert extract_audio.AudioExtractor(quality=quality, output_dir=output_dir).quality == quality
+
+def test_batch_video_file_discovery(tmp_path, output_dir, extract_audio, monkeypatch):
+    """Batch mode picks video files by extension like os.path.splitext would"""
+    for name in ('a.mp4', 'b.MKV', '.hidden.mov', '.mp4', 'mp4', 'notes.txt'):
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / 'folder.mp4').mkdir()
+
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir)
+    seen = []
+    def fake_group(video_files):
+        seen.extend(video_file.name for video_file in video_files)
+        return [True] * len(video_files)
+    monkeypatch.setattr(extractor, '_extract_batch_group', fake_group)
+
+    extractor.batch_extract_local(str(tmp_path))
+    assert sorted(seen) == ['.hidden.mov', 'a.mp4', 'b.MKV']
+
+def test_batch_skips_colliding_outputs(tmp_path, output_dir, extract_audio, monkeypatch, capsys):
+    """Only one of several files with the same stem writes the shared output"""
+    for name in ('clip.mp4', 'clip.mkv', 'other.mp4'):
+        (tmp_path / name).write_bytes(b'')
+
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir)
+    seen = []
+    def fake_group(video_files):
+        seen.extend(video_file.name for video_file in video_files)
+        return [True] * len(video_files)
+    monkeypatch.setattr(extractor, '_extract_batch_group', fake_group)
+
+    successful = extractor.batch_extract_local(str(tmp_path))
+    assert sorted(seen) == ['clip.mkv', 'other.mp4']
+    assert sorted(os.path.basename(path) for path in successful) == ['clip.mkv', 'other.mp4']
+
+    output = capsys.readouterr().out
+    assert "Skipping clip.mp4: its output would overwrite clip.mkv's (same name)" in output
+    assert 'Failed: 0' in output
+    assert 'Skipped: 1' in output
+
+def _compiled_args(extractor, source_codec, monkeypatch, **time_range):
+    """ffmpeg arguments _build_output produces for a source with the given audio codec"""
+    import ffmpeg
+    monkeypatch.setattr(extractor, '_probe_audio_codec', lambda input_path: source_codec)
+    output_path = extractor.output_dir / f"clip.{extractor.audio_format}"
+    return ffmpeg.compile(extractor._build_output(Path('clip.mp4'), output_path, **time_range))
+
+def test_build_output_stream_copy(output_dir, extract_audio, monkeypatch):
+    """A source already in the target codec is copied without re-encoding"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir, audio_format='mp3')
+    args = _compiled_args(extractor, 'mp3', monkeypatch)
+
+    assert args[args.index('-acodec') + 1] == 'copy'
+    assert '-vn' in args
+    assert '-b:a' not in args
+
+@pytest.mark.parametrize("fmt, source_codec, encoder", [
+    ('mp3', 'aac', 'libmp3lame'),  # codec differs from the target
+    ('mp3', None, 'libmp3lame'),   # probe failed
+    ('wav', 'aac', None),          # ffmpeg picks the encoder from the extension
+    ('flac', None, None),
+])
+def test_build_output_reencode(fmt, source_codec, encoder, output_dir, extract_audio, monkeypatch):
+    """Other sources are re-encoded with the quality settings"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir, audio_format=fmt)
+    args = _compiled_args(extractor, source_codec, monkeypatch)
+
+    assert args[args.index('-b:a') + 1] == '320k'
+    assert args[args.index('-ar') + 1] == '48000'
+    if encoder:
+        assert args[args.index('-acodec') + 1] == encoder
     else:
-        print(f"\\n⚠️  {failed} test(s) failed. Some functionality may need attention.")
-        
-    return failed == 0
+        assert '-acodec' not in args
+
+@pytest.mark.parametrize("time_range, option, value", [
+    ({'start_time': '2', 'end_time': '5'}, '-to', '5'),
+    ({'start_time': '2', 'duration': '3'}, '-t', '3'),
+])
+def test_build_output_time_range_on_input(time_range, option, value, output_dir, extract_audio, monkeypatch):
+    """-ss and -t/-to are input options, so -to is measured on the source timeline"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir, audio_format='mp3')
+    args = _compiled_args(extractor, 'mp3', monkeypatch, **time_range)
+
+    input_index = args.index('-i')
+    assert args.index('-ss') < input_index and args[args.index('-ss') + 1] == '2'
+    assert args.index(option) < input_index and args[args.index(option) + 1] == value
+    assert args.count(option) == 1
+
+@pytest.mark.parametrize("time_range, copied", [
+    ({'start_time': '1:30', 'duration': '30'}, True),          # whole seconds
+    ({'start_time': '1:00:00', 'end_time': '1:00:05'}, True),
+    ({'start_time': '1:30.500', 'duration': '30'}, False),     # sub-second start
+    ({'start_time': '90', 'duration': '0.250'}, False),        # sub-second duration
+    ({'start_time': '90', 'end_time': '1:35.001'}, False),     # sub-second end
+])
+def test_build_output_precise_cut(time_range, copied, output_dir, extract_audio, monkeypatch):
+    """Sub-second cuts are re-encoded even when the codec already matches"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir, audio_format='mp3')
+    time_range = {name: extract_audio.parse_time_format(value) for name, value in time_range.items()}
+    args = _compiled_args(extractor, 'mp3', monkeypatch, **time_range)
+
+    assert (args[args.index('-acodec') + 1] == 'copy') is copied
+
+def test_probe_audio_codec_cached(dummy_mp4, extractor, monkeypatch):
+    """ffprobe runs once per file and its codec name is reused"""
+    import ffmpeg
+    calls = []
+    def fake_probe(filename, **kwargs):
+        calls.append(filename)
+        return {'streams': [{'codec_name': 'aac'}]}
+    monkeypatch.setattr(ffmpeg, 'probe', fake_probe)
+    monkeypatch.setattr(extractor, '_probe_cache', {})
+
+    assert extractor._probe_audio_codec(Path(dummy_mp4)) == 'aac'
+    assert extractor._probe_audio_codec(Path(dummy_mp4)) == 'aac'
+    assert calls == [dummy_mp4]
+
+@pytest.mark.parametrize("probe_result", [
+    {'streams': []},  # no audio stream
+    {},               # no stream list at all
+])
+def test_probe_audio_codec_without_audio(probe_result, dummy_mp4, extractor, monkeypatch):
+    """Files without an audio stream report no codec"""
+    import ffmpeg
+    monkeypatch.setattr(ffmpeg, 'probe', lambda filename, **kwargs: probe_result)
+    monkeypatch.setattr(extractor, '_probe_cache', {})
+
+    assert extractor._probe_audio_codec(Path(dummy_mp4)) is None
+
+def test_probe_audio_codec_ffprobe_error(dummy_mp4, extractor, monkeypatch):
+    """A failing ffprobe falls back to re-encoding instead of raising"""
+    import ffmpeg
+    def failing_probe(filename, **kwargs):
+        raise ffmpeg.Error('ffprobe', b'', b'Invalid data found when processing input')
+    monkeypatch.setattr(ffmpeg, 'probe', failing_probe)
+    monkeypatch.setattr(extractor, '_probe_cache', {})
+
+    assert extractor._probe_audio_codec(Path(dummy_mp4)) is None
+
+@pytest.fixture
+def pool_sizes(extract_audio, monkeypatch):
+    """max_workers of every thread pool extract_audio creates during a test"""
+    sizes = []
+    real_executor = extract_audio.ThreadPoolExecutor
+    def recording_executor(max_workers=None, **kwargs):
+        sizes.append(max_workers)
+        return real_executor(max_workers=max_workers, **kwargs)
+    monkeypatch.setattr(extract_audio, 'ThreadPoolExecutor', recording_executor)
+    return sizes
+
+@pytest.mark.parametrize("jobs, expected_workers", [
+    (None, 3),  # one worker per URL, up to the default cap
+    (2, 2),
+])
+def test_extract_from_urls(jobs, expected_workers, output_dir, extract_audio, monkeypatch, pool_sizes):
+    """Downloads are bucketed by result and --jobs caps the pool"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir)
+    monkeypatch.setattr(extractor, 'extract_from_url', lambda url: 'bad' not in url)
+
+    urls = ['https://a.example/1', 'https://bad.example/2', 'https://a.example/3']
+    successful = extractor.extract_from_urls(urls, jobs)
+
+    assert sorted(successful) == ['https://a.example/1', 'https://a.example/3']
+    assert pool_sizes == [expected_workers]
+
+def test_extract_from_urls_default_cap(output_dir, extract_audio, monkeypatch, pool_sizes):
+    """Without --jobs, concurrent downloads stop at _MAX_CONCURRENT_DOWNLOADS"""
+    extractor = extract_audio.AudioExtractor(output_dir=output_dir)
+    monkeypatch.setattr(extractor, 'extract_from_url', lambda url: True)
+
+    urls = [f'https://a.example/{i}' for i in range(20)]
+    assert len(extractor.extract_from_urls(urls)) == 20
+    assert pool_sizes == [extract_audio._MAX_CONCURRENT_DOWNLOADS]
+
+def test_urls_command(output_dir, cli_runner, extract_audio, monkeypatch):
+    """The urls command passes every URL and --jobs to extract_from_urls"""
+    calls = []
+    monkeypatch.setattr(extract_audio.AudioExtractor, 'extract_from_urls',
+                        lambda self, urls, jobs=None: calls.append((urls, jobs)))
+
+    result = cli_runner.invoke(extract_audio.cli, [
+        '--output', output_dir, 'urls', 'https://a.example/1', 'https://a.example/2', '--jobs', '2'
+    ])
+    assert result.exit_code == 0, result.output
+    assert calls == [(['https://a.example/1', 'https://a.example/2'], 2)]
+
+@pytest.mark.parametrize("args", [
+    ['urls'],                                   # at least one URL is required
+    ['urls', 'https://a.example/1', '-j', '0'],  # --jobs must be positive
+])
+def test_urls_command_rejects_bad_arguments(args, output_dir, cli_runner, extract_audio):
+    """Invalid urls arguments are usage errors"""
+    result = cli_runner.invoke(extract_audio.cli, ['--output', output_dir, *args])
+    assert result.exit_code == 2
+
+@pytest.mark.parametrize("jobs, expected_workers, expected_groups", [
+    (None, None, None),   # default: one worker per CPU core
+    ('1', 1, [8, 8, 4]),  # one ffmpeg process, groups capped at _BATCH_GROUP_SIZE
+    ('4', 4, [5, 5, 5, 5]),
+])
+def test_batch_command_jobs(jobs, expected_workers, expected_groups, tmp_path, output_dir,
+                            cli_runner, extract_audio, monkeypatch, pool_sizes):
+    """batch --jobs caps the number of concurrent ffmpeg groups"""
+    for i in range(20):
+        (tmp_path / f"clip{i:02}.mp4").write_bytes(b'')
+    groups = []
+    def fake_group(self, video_files):
+        groups.append(len(video_files))
+        return [True] * len(video_files)
+    monkeypatch.setattr(extract_audio.AudioExtractor, '_extract_batch_group', fake_group)
+
+    args = ['--output', output_dir, 'batch', str(tmp_path)]
+    if jobs:
+        args += ['--jobs', jobs]
+    result = cli_runner.invoke(extract_audio.cli, args)
 
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    assert result.exit_code == 0, result.output
+    assert 'Successful: 20' in result.output
+    assert sum(groups) == 20
+    assert pool_sizes == [expected_workers or min(20, os.cpu_count() or 4)]
+    if expected_groups:
+        assert sorted(groups, reverse=True) == expected_groups
@@ -3,198 +3,103 @@
 Test script to verify millisecond precision support in audio extractor
 """
 
-import re
-from typing import Optional
+import click
+import pytest
 
-def parse_time_format(time_str: str) -> str:
-    """Parse and validate time format with millisecond precision support
-    
-    Supported formats:
-    - HH:MM:SS.mmm (e.g., 01:23:45.678)
-    - MM:SS.mmm (e.g., 23:45.123)
-    - SS.mmm (e.g., 45.500)
-    - Decimal seconds (e.g., 105.250)
-    
-    Where:
-    - HH: hours (0-99)
-    - MM: minutes (0-59)
-    - SS: seconds (0-59)
-    - mmm: milliseconds (0-999, 1-3 digits)
-    """
-    if not time_str:
-        raise ValueError("Time parameter cannot be empty")
-        
-    # Remove whitespace
-    time_str = time_str.strip()
-    
-    # Pattern for HH:MM:SS.mmm, MM:SS.mmm, or SS.mmm formats
-    # Supports millisecond precision with 1-3 digits
-    time_pattern = r'^(?:(?:([0-9]{1,2}):)?([0-5]?[0-9]):)?([0-5]?[0-9])(?:\.([0-9]{1,3}))?$'
-    
-    # Check if it's decimal seconds (integer or float with millisecond precision)
-    if re.match(r'^\d+(?:\.\d{1,3})?$', time_str):
-        return time_str
-    
-    # Check standard time format with optional milliseconds
-    match = re.match(time_pattern, time_str)
-    if match:
-        hours, minutes, seconds, milliseconds = match.groups()
-        
-        # Validate milliseconds don't exceed 999
-        if milliseconds and len(milliseconds) <= 3:
-            ms_value = int(milliseconds.ljust(3, '0'))  # Pad to 3 digits
-            if ms_value > 999:
-                raise ValueError(f"Invalid milliseconds: '{milliseconds}'. Must be 0-999")
-        
-        return time_str
-    
-    # If no match, raise an error with detailed format information
-    raise ValueError(
-        f"Invalid time format: '{time_str}'. "
-        "Supported formats:\n"
-        "  • HH:MM:SS.mmm (e.g., 01:23:45.678)\n"
-        "  • MM:SS.mmm (e.g., 23:45.123)\n"
-        "  • SS.mmm (e.g., 45.500)\n"
-        "  • Decimal seconds (e.g., 105.250)"
-    )
+_PARSE_CASES = (
+    pytest.param("1:23:45.678", id="HH:MM:SS.mmm format"),
+    pytest.param("23:45.123", id="MM:SS.mmm format"),
+    pytest.param("45.500", id="SS.mmm format"),
+    pytest.param("105.250", id="Decimal seconds with milliseconds"),
+    pytest.param("30.5", id="Decimal seconds with 1 decimal place"),
+    pytest.param("1:30", id="MM:SS format without milliseconds"),
+    pytest.param("01:23:45", id="HH:MM:SS format without milliseconds"),
+    pytest.param("123", id="Integer seconds"),
+    pytest.param("0:00:00.001", id="Minimum millisecond precision"),
+    pytest.param("1:23:45.999", id="Maximum millisecond precision"),
+    pytest.param("59:59.999", id="Maximum MM:SS.mmm"),
+    pytest.param("1.0", id="Decimal with zero fraction"),
+    pytest.param("00:01:23.750", id="Leading zeros with milliseconds"),
+)
 
-def test_time_parsing():
-    """Test various time formats including millisecond precision"""
-    
-    test_cases = [
-        # Valid formats
-        ("1:23:45.678", True, "HH:MM:SS.mmm format"),
-        ("23:45.123", True, "MM:SS.mmm format"),
-        ("45.500", True, "SS.mmm format"),
-        ("105.250", True, "Decimal seconds with milliseconds"),
-        ("30.5", True, "Decimal seconds with 1 decimal place"),
-        ("1:30", True, "MM:SS format without milliseconds"),
-        ("01:23:45", True, "HH:MM:SS format without milliseconds"),
-        ("123", True, "Integer seconds"),
-        ("0:00:00.001", True, "Minimum millisecond precision"),
-        ("1:23:45.999", True, "Maximum millisecond precision"),
-        ("59:59.999", True, "Maximum MM:SS.mmm"),
-        ("1.0", True, "Decimal with zero fraction"),
-        ("00:01:23.750", True, "Leading zeros with milliseconds"),
-        
-        # Invalid formats
-        ("1:23:45.1234", False, "Too many decimal places"),
-        ("1:61:45", False, "Invalid minutes"),
-        ("1:23:61", False, "Invalid seconds"),
-        ("1:23:45.1000", False, "Milliseconds > 999"),
-        ("", False, "Empty string"),
-        ("abc", False, "Non-numeric"),
-        ("1:2:3:4", False, "Too many colons"),
-        ("1:-2:3", False, "Negative values"),
-        ("1:23:45.abc", False, "Non-numeric milliseconds"),
-    ]
-    
-    print("Testing millisecond time parsing functionality...\n")
-    
-    passed = 0
-    failed = 0
-    
-    for time_input, should_pass, description in test_cases:
-        try:
-            result = parse_time_format(time_input)
-            if should_pass:
-            print(f"PASS: '{time_input}' -> '{result}' ({description})")
-                passed += 1
-            else:
-                print(f"FAIL: '{time_input}' should have failed but got '{result}' ({description})")
-                failed += 1
-        except (ValueError, Exception) as e:
-            if not should_pass:
-                print(f"PASS: '{time_input}' correctly failed - {str(e).split('.')[0]} ({description})")
-                passed += 1
-            else:
-                print(f"FAIL: '{time_input}' should have passed but failed - {e} ({description})")
-                failed += 1
-    
-    print(f"\nTest Results:")
-    print(f"   Passed: {passed}")
-    print(f"   Failed: {failed}")
-    print(f"   Total:  {passed + failed}")
-    
-    if failed == 0:
-    print("\nAll tests passed! Millisecond support is working correctly.")
-        return True
-    else:
-        print(f"\n{failed} test(s) failed. Please check the implementation.")
-        return False
+_INVALID_CASES = (
+    pytest.param("1:23:45.1234", id="Too many decimal places"),
+    pytest.param("1:61:45", id="Invalid minutes"),
+    pytest.param("1:23:61", id="Invalid seconds"),
+    pytest.param("1:23:45.1000", id="Milliseconds > 999"),
+    pytest.param("", id="Empty string"),
+    pytest.param("abc", id="Non-numeric"),
+    pytest.param("1:2:3:4", id="Too many colons"),
+    pytest.param("1:-2:3", id="Negative values"),
+    pytest.param("1:23:45.abc", id="Non-numeric milliseconds"),
+)
 
-def test_time_to_seconds():
+_CONVERT_CASES = (
+    pytest.param("1:23:45.678", 5025.678, id="HH:MM:SS.mmm conversion"),
+    pytest.param("23:45.123", 1425.123, id="MM:SS.mmm conversion"),
+    pytest.param("45.500", 45.5, id="SS.mmm conversion"),
+    pytest.param("105.250", 105.25, id="Decimal seconds conversion"),
+    pytest.param("0:00:01.001", 1.001, id="Millisecond precision"),
+    pytest.param("1:00:00.000", 3600.0, id="Hour boundary with milliseconds"),
+)
+
+_CONVERT_MS_CASES = (
+    pytest.param("1:23:45.678", 5025678, id="HH:MM:SS.mmm conversion"),
+    pytest.param("23:45.123", 1425123, id="MM:SS.mmm conversion"),
+    pytest.param("45.500", 45500, id="SS.mmm conversion"),
+    pytest.param("105.250", 105250, id="Decimal seconds conversion"),
+    pytest.param("0:00:01.001", 1001, id="Millisecond precision"),
+    pytest.param("1:00:00.000", 3600000, id="Hour boundary with milliseconds"),
+    pytest.param("30.5", 30500, id="Short fraction padded to milliseconds"),
+    pytest.param("123", 123000, id="Integer seconds"),
+    pytest.param(" 5.5 ", 5500, id="Surrounding whitespace"),
+)
+
+_INVALID_MS_CASES = (
+    pytest.param("-1.5", id="Negative decimal seconds"),
+    pytest.param("1:-0.5", id="Negative seconds field"),
+    pytest.param("-1:30", id="Negative minutes field"),
+    pytest.param("+1.5", id="Explicit plus sign"),
+    pytest.param(".5", id="Missing whole seconds"),
+    pytest.param("1.2345", id="Sub-millisecond precision"),
+    pytest.param("1:2:3:4", id="Too many colons"),
+    pytest.param("abc", id="Non-numeric"),
+    pytest.param("", id="Empty string"),
+)
+
+@pytest.mark.parametrize("time_input", _PARSE_CASES)
+def test_time_parsing_valid(time_input, time_fns):
+    """Test that millisecond-precision time formats are accepted"""
+    parse_time_format, _ = time_fns
+    assert parse_time_format(time_input) == time_input
+
+@pytest.mark.parametrize("time_input", _INVALID_CASES)
+def test_time_parsing_invalid(time_input, time_fns):
+    """Test that malformed time formats are rejected"""
+    parse_time_format, _ = time_fns
+    with pytest.raises(click.BadParameter):
+        parse_time_format(time_input)
+
+@pytest.mark.parametrize("time_input, expected", _CONVERT_CASES)
+def test_time_to_seconds(time_input, expected, time_fns):
     """Test conversion of time strings to seconds with millisecond precision"""
-    
-    def time_to_seconds(time_str: str) -> float:
-        """Convert time string to seconds"""
-        if not time_str:
-            return 0
-            
-        # If it's already in seconds (float or int)
-        if re.match(r'^\d+(?:\.\d+)?$', time_str):
-            return float(time_str)
-            
-        # Parse HH:MM:SS, MM:SS format
-        parts = time_str.split(':')
-        if len(parts) == 3:  # HH:MM:SS
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-        elif len(parts) == 2:  # MM:SS
-            return int(parts[0]) * 60 + float(parts[1])
-        else:
-            return float(time_str)
-    
-    print("\nTesting time-to-seconds conversion with millisecond precision...\n")
-    
-    test_cases = [
-        ("1:23:45.678", 5025.678, "HH:MM:SS.mmm conversion"),
-        ("23:45.123", 1425.123, "MM:SS.mmm conversion"),
-        ("45.500", 45.5, "SS.mmm conversion"),
-        ("105.250", 105.25, "Decimal seconds conversion"),
-        ("0:00:01.001", 1.001, "Millisecond precision"),
-        ("1:00:00.000", 3600.0, "Hour boundary with milliseconds"),
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for time_input, expected, description in test_cases:
-        try:
-            result = time_to_seconds(time_input)
-            if abs(result - expected) < 0.001:  # Allow for floating point precision
-                print(f"PASS: '{time_input}' -> {result}s (expected {expected}s) ({description})")
-                passed += 1
-            else:
-                print(f"FAIL: '{time_input}' -> {result}s but expected {expected}s ({description})")
-                failed += 1
-        except Exception as e:
-            print(f"FAIL: '{time_input}' failed with error - {e} ({description})")
-            failed += 1
-    
-    print(f"\nConversion Test Results:")
-    print(f"   Passed: {passed}")
-    print(f"   Failed: {failed}")
-    print(f"   Total:  {passed + failed}")
-    
-    return failed == 0
+    _, time_to_seconds = time_fns
+    assert time_to_seconds(time_input) == pytest.approx(expected, abs=0.001)
+
+@pytest.mark.parametrize("time_input, expected", _CONVERT_MS_CASES)
+def test_time_to_ms(time_input, expected, extract_audio):
+    """Test exact conversion of time strings to integer milliseconds"""
+    assert extract_audio.time_to_ms(time_input) == expected
+
+@pytest.mark.parametrize("time_input", _INVALID_MS_CASES)
+def test_time_to_ms_invalid(time_input, extract_audio):
+    """Test that signed and malformed inputs are rejected rather than miscounted"""
+    with pytest.raises(click.BadParameter):
+        extract_audio.time_to_ms(time_input)
 
-if __name__ == "__main__":
-    print("Audio Extractor Millisecond Support Test Suite\n")
-    print("=" * 60)
-    
-    parsing_success = test_time_parsing()
-    conversion_success = test_time_to_seconds()
-    
-    print("\n" + "=" * 60)
-    if parsing_success and conversion_success:
-        print("All tests passed! Millisecond support is fully functional.")
-        print("\nYour audio extractor now supports:")
-        print("  • HH:MM:SS.mmm format (e.g., 01:23:45.678)")
-        print("  • MM:SS.mmm format (e.g., 23:45.123)")
-        print("  • SS.mmm format (e.g., 45.500)")
-        print("  • Decimal seconds with millisecond precision (e.g., 105.250)")
-        print("\nExample usage:")
-        print("  python src/extract_audio.py --format mp3 local video.mp4 \\")
-        print("    --start-time 1:23.456 --duration 30.750")
-    else:
-        print("Some tests failed. Please review the implementation.")
+def test_parsed_time_milliseconds(time_fns):
+    """Test that parsed times carry the same exact value time_to_ms returns"""
+    parse_time_format, _ = time_fns
+    parsed = parse_time_format("1:23:45.678")
+    assert parsed.milliseconds == 5025678
+    assert parsed.seconds == 5025.678